@@ -1,97 +1,112 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+import lxml.etree
+import lxml.html
 import csv
 import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 BASE_URL = "https://www.bbc.com"
 CSV_FILE = "articles.csv"
+MAX_WORKERS = 20
+REQUEST_DELAY = 0.1  # seconds each worker waits before a request, to go easy on the host
+FIELDS = ['Timestamp', 'URL', 'Title', 'Content']
+ARTICLE_HREF_RE = re.compile(r"^(?!.*(?:live|av)).*/news")
 
-def get_article_links():
-    res = requests.get(f"{BASE_URL}/news")
-    soup = BeautifulSoup(res.text, "lxml")
+def parse_html(content):
+    # BBC serves UTF-8; one parser per call since lxml parsers aren't shared across threads
+    return lxml.html.fromstring(content, parser=lxml.html.HTMLParser(encoding="utf-8"))
 
-    links = soup.select('a[href*="/news"]')
 
-    article_urls = []
-    for link in links:
-        href = link.get("href")
-        if href and "/news" in href and "live" not in href and "av" not in href:
-            if href.startswith("/"):
-                href = BASE_URL + href
-            article_urls.append(href)
+class LinkTarget:
+    # Parser target that only collects a[href*="/news"], without building a tree
+    def __init__(self):
+        self.hrefs = []
 
-    return list(set(article_urls))  
+    def start(self, tag, attrib):
+        href = attrib.get("href", "")
+        if tag == "a" and "/news" in href:
+            self.hrefs.append(href)
 
+    def end(self, tag):
+        pass
 
-def scrape_article(url):
-    res = requests.get(url)
-    soup = BeautifulSoup(res.text, "lxml")
+    def data(self, data):
+        pass
 
-    title_tag = soup.select_one("h1")
-    title = title_tag.text.strip() if title_tag else "No title"
+    def close(self):
+        return self.hrefs
 
-    paragraphs = soup.select("article p")
-    content = "\n".join([p.text.strip() for p in paragraphs])
+
+def get_article_links(session):
+    res = session.get(f"{BASE_URL}/news", timeout=10)
+    parser = lxml.etree.HTMLParser(target=LinkTarget(), encoding="utf-8")
+    hrefs = lxml.etree.fromstring(res.content, parser)
+
+    article_urls = {
+        BASE_URL + href if href.startswith("/") else href
+        for href in hrefs
+        if ARTICLE_HREF_RE.match(href)
+    }
+
+    return list(article_urls)
+
+
+def load_seen_urls():
+    if not os.path.isfile(CSV_FILE):
+        return set()
+
+    with open(CSV_FILE, 'r', encoding='utf-8') as f:
+        return {row['URL'] for row in csv.DictReader(f)}
+
+
+def scrape_article(session, url):
+    time.sleep(REQUEST_DELAY)
+    try:
+        res = session.get(url, timeout=10)
+        doc = parse_html(res.content)
+    except (requests.RequestException, lxml.etree.ParserError) as e:
+        # Empty content gets the row dropped; one bad URL shouldn't lose the run
+        print(f"Failed to scrape {url}: {e}")
+        return "No title", ""
+
+    title = doc.xpath("string((//h1)[1])").strip() or "No title"
+
+    content = "\n".join(p.text_content().strip() for p in doc.xpath("//article//p"))
 
     return title, content
 
 
-def save_to_csv(url, title, content):
-    
-    file_exists = os.path.isfile(CSV_FILE)
-    
-    with open(CSV_FILE, 'a', newline='', encoding='utf-8') as csvfile:
-        fieldnames = ['Timestamp', 'URL', 'Title', 'Content']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        
-        if not file_exists:
-            writer.writeheader()
-        
-        writer.writerow({
-            'Timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+seen = load_seen_urls()
+
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
+links = get_article_links(session)
+todo = [u for u in links if u not in seen]
+print(f"Found {len(links)} article links, {len(todo)} new articles")
+
+timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+results = []
+with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+    for url, (title, content) in zip(todo, ex.map(lambda u: scrape_article(session, u), todo)):
+        if not content.strip():
+            continue
+        results.append({
+            'Timestamp': timestamp,
             'URL': url,
             'Title': title,
             'Content': content
         })
 
-
-def remove_duplicate_urls():
-    if not os.path.isfile(CSV_FILE):
-        return
-    
-    rows = []
-    with open(CSV_FILE, 'r', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        rows = list(reader)
-    
-    seen_urls = {}
-    for i, row in enumerate(rows):
-        url = row['URL']
-        seen_urls[url] = i  
-    
-    unique_rows = [rows[i] for url, i in seen_urls.items()]
-    
-    cleaned_rows = [row for row in unique_rows if row["Content"].strip() != ""]
-    
-    with open(CSV_FILE, 'w', newline='', encoding='utf-8') as csvfile:
-        fieldnames = ['Timestamp', 'URL', 'Title', 'Content']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+new_file = not os.path.isfile(CSV_FILE)
+with open(CSV_FILE, 'a', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+    writer = csv.DictWriter(csvfile, fieldnames=FIELDS)
+    if new_file:
         writer.writeheader()
-        writer.writerows(cleaned_rows)
-    
-    print(f"Removed duplicates. Kept {len(unique_rows)} unique articles.")
-
-
-links = get_article_links()
-print(f"Found {len(links)} article links")
-
-for url in links:  
-    title, content = scrape_article(url)
-    
-    save_to_csv(url, title, content)
-    print(f"Saved to {CSV_FILE}")
+    writer.writerows(results)
 
 print(f"All articles saved to {CSV_FILE}")
-
-remove_duplicate_urls()
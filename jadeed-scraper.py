@@ -2,16 +2,21 @@ import argparse
 import csv
 import logging
 import os
+import re
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, List, Set, Optional
 
+import lxml.etree
+import lxml.html
+import requests
+from requests.adapters import HTTPAdapter
 from dateutil import parser as date_parser
 
 from selenium import webdriver
 from selenium.common.exceptions import (
-    NoSuchElementException,
     TimeoutException,
     WebDriverException,
 )
@@ -32,12 +37,39 @@ LOAD_MORE_XPATH = "//*[contains(text(), 'المزيد')]"
 
 ARTICLE_TITLE_SELECTOR = "h1" 
 
+# Same title lookup as XPath, for the lxml (HTTP) path
+ARTICLE_TITLE_XPATH = "string((//h1)[1])"
+
+ARTICLE_SHORT_DESC_ID = "ctl00_MainContent_ArticleDetailsDescription21_lblShortDesc"
+
+# Responses smaller than this are treated as a block/stub page, not an article
+MIN_ARTICLE_BYTES = 400
+
+HTTP_TIMEOUT = 15
+
+# Concurrent HTTP article fetches per batch of notifications
+MAX_WORKERS = 20
+
 ARTICLE_BODY_CANDIDATES = [
     "article p",
     ".news-body p",
     ".article-body p",
 ]
 
+# Same candidates as XPath, for the lxml (HTTP) path
+ARTICLE_BODY_CANDIDATES_XPATH = [
+    "//article//p",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' news-body ')]//p",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' article-body ')]//p",
+]
+
+LONG_DESC_SELECTOR = ".LongDesc"
+
+LONG_DESC_XPATH = "//*[contains(concat(' ', normalize-space(@class), ' '), ' LongDesc ')]"
+
+# Article datetime as shown on the page, e.g. '2025-11-18 | 13:57'
+PUBLISHED_DT_RE = re.compile(r"\d{4}-\d{2}-\d{2}\s*\|\s*\d{2}:\d{2}")
+
 KNOWN_CATEGORIES = [
     "محليات",
     "عربي و دولي",
@@ -48,6 +80,23 @@ KNOWN_CATEGORIES = [
     "فن و منوعات",
 ]
 
+KNOWN_CATEGORIES_SET = frozenset(KNOWN_CATEGORIES)
+
+# Subresources the browser never needs to fetch (blocked via CDP)
+BLOCKED_URL_PATTERNS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.svg",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.css",
+    "*.mp4",
+]
+
 # CSV columns
 CSV_FIELDS = [
     "ScrapedAt",       # When we scraped it
@@ -96,34 +145,33 @@ def setup_logger(log_path: str) -> logging.Logger:
 
 # ---------- CSV HELPERS ----------
 
-def load_existing_articles(csv_path: str, logger: logging.Logger):
+def load_existing_urls(csv_path: str, logger: logging.Logger) -> Set[str]:
     """
-    Load existing CSV file if it exists, return:
-        - existing_rows: list of dicts
-        - existing_urls: set of URL strings
+    Stream the existing CSV file (if any) and return the set of URLs in it.
+    Rows are not kept in memory; only the URLs are needed for dedupe.
     Uses utf-8-sig so Excel handles Arabic nicely.
     """
-    existing_rows: List[Dict[str, str]] = []
     existing_urls: Set[str] = set()
 
     if not os.path.exists(csv_path):
         logger.info("CSV file %s does not exist yet; will create a new one.", csv_path)
-        return existing_rows, existing_urls
+        return existing_urls
 
     logger.info("Loading existing CSV: %s", csv_path)
+    row_count = 0
     with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            existing_rows.append(row)
-            if row.get("URL"):
-                existing_urls.add(row["URL"])
+        for row in csv.DictReader(f):
+            row_count += 1
+            url = row.get("URL")
+            if url:
+                existing_urls.add(url)
 
     logger.info(
         "Loaded %d existing rows, %d unique URLs.",
-        len(existing_rows),
+        row_count,
         len(existing_urls),
     )
-    return existing_rows, existing_urls
+    return existing_urls
 
 
 def write_full_csv(
@@ -147,31 +195,62 @@ def write_full_csv(
     logger.debug("Wrote %d rows to CSV: %s", len(all_rows), csv_path)
 
 
-def prepend_article_to_csv_top(
-    csv_path: str,
-    all_rows: List[Dict[str, str]],
+def open_csv_for_append(csv_path: str):
+    """
+    Open the CSV once in append mode and return (file, DictWriter).
+    Writes the header if the file is new or empty.
+    """
+    f = open(csv_path, "a", encoding="utf-8-sig", newline="")
+    writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+    if f.tell() == 0:
+        writer.writeheader()
+        f.flush()
+    return f, writer
+
+
+def append_article_to_csv(
+    csvfile,
+    writer: csv.DictWriter,
     existing_urls: Set[str],
     article: Dict[str, str],
     logger: logging.Logger,
-):
+) -> bool:
     """
-    Insert new article dict at the TOP of all_rows and rewrite the CSV.
+    Append a new article row to the open CSV and flush it to disk.
     Prevents duplicates using existing_urls.
+    Returns True if the row was written.
     """
     url = article.get("URL")
     if not url:
         logger.warning("Article has no URL, skipping: %s", article)
-        return
+        return False
 
     if url in existing_urls:
         logger.debug("Duplicate URL (already in CSV), skipping: %s", url)
-        return
+        return False
 
     existing_urls.add(url)
-    all_rows.insert(0, article)  # prepend newest at top
+    writer.writerow(article)
+    csvfile.flush()
     logger.info("Added article: %s", article.get("Title"))
+    return True
+
 
-    write_full_csv(csv_path, all_rows, logger)
+def move_new_rows_to_top(csv_path: str, added: int, logger: logging.Logger):
+    """
+    Rewrite the CSV once so the last `added` rows (appended during this run)
+    sit at the top, last appended first, like the old prepend-per-article layout.
+    """
+    if not added:
+        return
+
+    with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
+        rows = list(csv.DictReader(f))
+
+    split = len(rows) - added
+    new_rows = rows[split:]
+    new_rows.reverse()
+    write_full_csv(csv_path, new_rows + rows[:split], logger)
 
 
 # ---------- SELENIUM SETUP ----------
@@ -180,6 +259,8 @@ def create_driver(headless: bool = True) -> webdriver.Chrome:
     """
     Create and return a Selenium Chrome/Chromium driver with sane defaults.
     If you're using Chrome Canary, set options.binary_location accordingly.
+    Set the CHROMEDRIVER env var to a chromedriver path to skip the
+    webdriver-manager lookup on startup.
     """
     options = webdriver.ChromeOptions()
 
@@ -190,12 +271,21 @@ def create_driver(headless: bool = True) -> webdriver.Chrome:
         options.add_argument("--headless=new")
     options.add_argument("--disable-gpu")
     options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--window-size=1920,1080")
     options.add_argument("--lang=ar,en-US")
 
+    # Return from driver.get() at DOMContentLoaded; we never need subresources
+    options.page_load_strategy = "eager"
+
     # For Canary you can also try chrome_type="chromium", but default usually works:
-    service = Service(ChromeDriverManager().install())
+    driver_path = os.environ.get("CHROMEDRIVER") or ChromeDriverManager().install()
+    service = Service(driver_path)
     driver = webdriver.Chrome(service=service, options=options)
+
+    # Only text and links are scraped; skip images, fonts, styles and video
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
     return driver
 
 
@@ -206,14 +296,24 @@ def extract_published_datetime_text(driver: webdriver.Chrome) -> Optional[str]:
     Try to find the element containing the datetime string like:
         '2025-11-18 | 13:57'
     by scanning elements that contain '|' and look like dates.
+    The scan runs in the browser so only the matching text crosses the wire.
     """
-    import re
-
-    candidates = driver.find_elements(By.XPATH, "//*[contains(text(), '|')]")
-    for el in candidates:
-        text = el.text.strip()
-        if re.search(r"\d{4}-\d{2}-\d{2}\s*\|\s*\d{2}:\d{2}", text):
-            return text
+    text = driver.execute_script(
+        """
+        const re = /\\d{4}-\\d{2}-\\d{2}\\s*\\|\\s*\\d{2}:\\d{2}/;
+        const found = document.evaluate(
+            "//*[contains(text(), '|')]", document, null,
+            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        for (let i = 0; i < found.snapshotLength; i++) {
+            const t = (found.snapshotItem(i).innerText || '').trim();
+            if (re.test(t)) return t;
+        }
+        return null;
+        """
+    )
+    if text and PUBLISHED_DT_RE.search(text):
+        return text
     return None
 
 
@@ -230,74 +330,149 @@ def parse_published_datetime(dt_text: str) -> Optional[datetime]:
         return None
 
 
+def get_published_dt(article: Dict[str, str], logger: logging.Logger) -> Optional[datetime]:
+    """
+    Read back the datetime stored in an article's PublishedAt field.
+    Returns None if it's missing or can't be parsed.
+    """
+    published_at_str = article.get("PublishedAt")
+    if not published_at_str:
+        return None
+    try:
+        return datetime.fromisoformat(published_at_str)
+    except Exception:
+        logger.debug("Failed to parse PublishedAt isoformat: %s", published_at_str)
+        return None
+
+
 def extract_category(driver: webdriver.Chrome) -> str:
     """
     Look through all links on the article page and return the first whose
     text matches one of the known categories.
+    Runs as a single script in the browser instead of one WebDriver call per link.
     """
-    for a in driver.find_elements(By.TAG_NAME, "a"):
-        text = a.text.strip()
-        if text in KNOWN_CATEGORIES:
-            return text
-    return ""
+    return driver.execute_script(
+        """
+        const cats = arguments[0];
+        for (const a of document.querySelectorAll('a')) {
+            const t = a.textContent.trim();
+            if (cats.includes(t)) return t;
+        }
+        return '';
+        """,
+        KNOWN_CATEGORIES,
+    ) or ""
 
 
 def extract_body(driver: webdriver.Chrome, logger: logging.Logger) -> str:
     """
     Extract the article body from Al Jadeed.
     Body = ShortDesc + LongDesc
+    All texts (including the generic fallback) come back from a single
+    execute_script call instead of one WebDriver round-trip per element.
     """
+    found = driver.execute_script(
+        """
+        const shortEl = document.getElementById(arguments[0]);
+        const longEl = document.querySelector(arguments[1]);
+        const shortDesc = shortEl ? shortEl.innerText.trim() : null;
+        const longDesc = longEl ? longEl.innerText.trim() : null;
+        const paragraphs = [];
+        if (!shortDesc && !longDesc) {
+            for (const sel of arguments[2]) {
+                for (const el of document.querySelectorAll(sel)) {
+                    const t = el.innerText.trim();
+                    if (t) paragraphs.push(t);
+                }
+            }
+        }
+        return {shortDesc: shortDesc, longDesc: longDesc, paragraphs: paragraphs};
+        """,
+        ARTICLE_SHORT_DESC_ID,
+        LONG_DESC_SELECTOR,
+        ARTICLE_BODY_CANDIDATES,
+    )
+
     full_text_parts = []
 
     # 1) SHORT DESCRIPTION
-    try:
-        short_desc = driver.find_element(
-            By.ID, "ctl00_MainContent_ArticleDetailsDescription21_lblShortDesc"
-        ).text.strip()
-        if short_desc:
-            full_text_parts.append(short_desc)
-    except:
+    short_desc = found["shortDesc"]
+    if short_desc is None:
         logger.debug("Short description not found.")
+    elif short_desc:
+        full_text_parts.append(short_desc)
 
     # 2) LONG DESCRIPTION
-    try:
-        long_desc_container = driver.find_element(By.CSS_SELECTOR, ".LongDesc")
-        long_desc_text = long_desc_container.text.strip()
-        if long_desc_text:
-            # Remove "Related Articles" section by truncating if needed
-            cleaned = long_desc_text.split("مقالات ذات صلة")[0].strip()
-            full_text_parts.append(cleaned)
-    except:
+    long_desc_text = found["longDesc"]
+    if long_desc_text is None:
         logger.debug("Long description container not found.")
+    elif long_desc_text:
+        # Remove "Related Articles" section by truncating if needed
+        cleaned = long_desc_text.split("مقالات ذات صلة")[0].strip()
+        full_text_parts.append(cleaned)
 
     # If both failed → fallback to generic candidates
     if not full_text_parts:
         logger.debug("Falling back to generic body extraction.")
-        paragraphs = []
-        for selector in ARTICLE_BODY_CANDIDATES:
-            try:
-                elems = driver.find_elements(By.CSS_SELECTOR, selector)
-                for e in elems:
-                    txt = e.text.strip()
-                    if txt:
-                        paragraphs.append(txt)
-            except:
-                pass
-
-        if paragraphs:
-            return "\n".join(paragraphs)
+        if found["paragraphs"]:
+            return "\n".join(found["paragraphs"])
 
     return "\n\n".join(full_text_parts).strip()
 
 
-def scrape_article_in_new_tab(
+def build_article(
+    url: str,
+    title: str,
+    dt_text: Optional[str],
+    category: str,
+    body: str,
+) -> Dict[str, str]:
+    """
+    Assemble a CSV row from the pieces extracted off an article page.
+    """
+    published_at = ""
+    if dt_text:
+        published_dt = parse_published_datetime(dt_text)
+        if published_dt:
+            published_at = published_dt.isoformat(timespec="minutes")
+
+    return {
+        "ScrapedAt": datetime.now().isoformat(timespec="seconds"),
+        "PublishedAt": published_at,
+        "URL": url,
+        "Title": title,
+        "Body": body,
+        "Category": category,
+        "IsNotificationOnly": "True" if not body else "False",
+    }
+
+
+def open_article_tab(driver: webdriver.Chrome) -> str:
+    """
+    Open one blank tab to be reused for every Selenium-scraped article.
+    Focus stays on the current window. Returns the new tab's handle.
+    """
+    original_window = driver.current_window_handle
+    existing = set(driver.window_handles)
+
+    driver.execute_script("window.open('about:blank');")
+    WebDriverWait(driver, 10).until(
+        lambda d: len(d.window_handles) > len(existing)
+    )
+    driver.switch_to.window(original_window)
+    return [w for w in driver.window_handles if w not in existing][0]
+
+
+def scrape_article_in_tab(
     driver: webdriver.Chrome,
+    article_tab: str,
     url: str,
     logger: logging.Logger,
     max_retries: int = 3,
 ) -> Optional[Dict[str, str]]:
     """
-    Open article URL in a new tab, scrape metadata and body, then close it.
+    Load article URL in the shared article tab, scrape metadata and body,
+    then switch back. The tab is left open for the next article.
     Returns a dict or None if all retries fail.
     """
     original_window = driver.current_window_handle
@@ -306,14 +481,8 @@ def scrape_article_in_new_tab(
         try:
             logger.debug(f"[Article Retry {attempt}/{max_retries}] {url}")
 
-            # Open a new tab
-            driver.execute_script("window.open(arguments[0]);", url)
-
-            WebDriverWait(driver, 10).until(
-                lambda d: len(d.window_handles) > 1
-            )
-            new_window = [w for w in driver.window_handles if w != original_window][0]
-            driver.switch_to.window(new_window)
+            driver.switch_to.window(article_tab)
+            driver.get(url)
 
             # Wait for title as basic readiness
             WebDriverWait(driver, 10).until(
@@ -323,46 +492,22 @@ def scrape_article_in_new_tab(
             title_el = driver.find_element(By.CSS_SELECTOR, ARTICLE_TITLE_SELECTOR)
             title = title_el.text.strip()
 
-            # Datetime
-            dt_text = extract_published_datetime_text(driver)
-            published_at = ""
-            published_dt = None
-            if dt_text:
-                published_dt = parse_published_datetime(dt_text)
-                if published_dt:
-                    published_at = published_dt.isoformat(timespec="minutes")
-
-            category = extract_category(driver)
-            body = extract_body(driver, logger)
-            is_notification_only = "True" if not body else "False"
-
-            article = {
-                "ScrapedAt": datetime.now().isoformat(timespec="seconds"),
-                "PublishedAt": published_at,
-                "URL": url,
-                "Title": title,
-                "Body": body,
-                "Category": category,
-                "IsNotificationOnly": is_notification_only,
-            }
+            article = build_article(
+                url,
+                title,
+                extract_published_datetime_text(driver),
+                extract_category(driver),
+                extract_body(driver, logger),
+            )
 
-            logger.info("Scraped article: %s (category=%s)", title, category or "N/A")
+            logger.info("Scraped article: %s (category=%s)", title, article["Category"] or "N/A")
 
-            driver.close()
             driver.switch_to.window(original_window)
             return article
 
         except Exception as e:
             logger.error("Error scraping article %s (attempt %d): %s", url, attempt, e)
             logger.debug("Full traceback:", exc_info=True)
-            # Ensure we close any new tab we might have opened
-            for handle in driver.window_handles:
-                if handle != original_window:
-                    try:
-                        driver.switch_to.window(handle)
-                        driver.close()
-                    except Exception:
-                        pass
             driver.switch_to.window(original_window)
             time.sleep(2)
 
@@ -370,6 +515,153 @@ def scrape_article_in_new_tab(
     return None
 
 
+# ---------- ARTICLE SCRAPING (HTTP) ----------
+
+def create_http_session(driver: webdriver.Chrome) -> requests.Session:
+    """
+    Build a requests session that looks like the Selenium browser:
+    same User-Agent and the cookies set while loading the notifications page.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = driver.execute_script("return navigator.userAgent;")
+    for cookie in driver.get_cookies():
+        session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"))
+    return session
+
+
+def element_text(el: lxml.html.HtmlElement) -> str:
+    """
+    Approximate Selenium's rendered .text for an lxml element:
+    <br> and block elements become line breaks, blank lines are dropped.
+    """
+    for child in el.iter("br", "p", "div", "li"):
+        child.tail = "\n" + (child.tail or "")
+    lines = (line.strip() for line in el.text_content().splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def extract_published_datetime_text_html(doc: lxml.html.HtmlElement) -> Optional[str]:
+    """
+    lxml version of extract_published_datetime_text().
+    Only the text nodes containing '|' are checked, not whole elements.
+    """
+    for text in doc.xpath("//text()[contains(., '|')]"):
+        if PUBLISHED_DT_RE.search(text):
+            return text.strip()
+    return None
+
+
+def extract_category_html(doc: lxml.html.HtmlElement) -> str:
+    """
+    lxml version of extract_category().
+    """
+    for a in doc.iter("a"):
+        text = a.text_content().strip()
+        if text in KNOWN_CATEGORIES_SET:
+            return text
+    return ""
+
+
+def extract_body_html(doc: lxml.html.HtmlElement, logger: logging.Logger) -> str:
+    """
+    lxml version of extract_body().
+    Body = ShortDesc + LongDesc, with the same generic fallback.
+    """
+    full_text_parts = []
+
+    # 1) SHORT DESCRIPTION
+    short_el = doc.xpath("//*[@id=$id]", id=ARTICLE_SHORT_DESC_ID)
+    short_desc = element_text(short_el[0]) if short_el else ""
+    if short_desc:
+        full_text_parts.append(short_desc)
+    else:
+        logger.debug("Short description not found.")
+
+    # 2) LONG DESCRIPTION
+    long_el = doc.xpath(LONG_DESC_XPATH)
+    long_desc_text = element_text(long_el[0]) if long_el else ""
+    if long_desc_text:
+        # Remove "Related Articles" section by truncating if needed
+        cleaned = long_desc_text.split("مقالات ذات صلة")[0].strip()
+        full_text_parts.append(cleaned)
+    else:
+        logger.debug("Long description container not found.")
+
+    # If both failed → fallback to generic candidates
+    if not full_text_parts:
+        logger.debug("Falling back to generic body extraction.")
+        paragraphs = []
+        for selector in ARTICLE_BODY_CANDIDATES_XPATH:
+            for e in doc.xpath(selector):
+                txt = element_text(e)
+                if txt:
+                    paragraphs.append(txt)
+
+        if paragraphs:
+            return "\n".join(paragraphs)
+
+    return "\n\n".join(full_text_parts).strip()
+
+
+def scrape_article_http(
+    session: requests.Session,
+    url: str,
+    logger: logging.Logger,
+) -> Optional[Dict[str, str]]:
+    """
+    Fetch the article with a plain HTTP request and parse it with lxml.
+    Returns None when the page can't be used this way (error status, stub page,
+    no title in the server-rendered HTML) so the caller can fall back to
+    scrape_article_in_tab().
+    """
+    try:
+        res = session.get(url, timeout=HTTP_TIMEOUT)
+    except requests.RequestException as e:
+        logger.debug("HTTP fetch failed for %s: %s", url, e)
+        return None
+
+    if not res.ok or len(res.content) < MIN_ARTICLE_BYTES:
+        logger.debug(
+            "HTTP fetch unusable for %s (status=%d, %d bytes).",
+            url,
+            res.status_code,
+            len(res.content),
+        )
+        return None
+
+    # Decode with the charset from Content-Type; without one lxml would guess
+    # latin-1 on pages lacking <meta charset>. requests reports ISO-8859-1 for
+    # any text/* response without a charset, so default to UTF-8 in that case.
+    if "charset" in res.headers.get("Content-Type", "").lower():
+        encoding = res.encoding
+    else:
+        encoding = "utf-8"
+    try:
+        doc = lxml.html.fromstring(res.content, parser=lxml.html.HTMLParser(encoding=encoding))
+    except lxml.etree.ParserError as e:
+        logger.debug("Could not parse HTML for %s: %s", url, e)
+        return None
+
+    title = doc.xpath(ARTICLE_TITLE_XPATH).strip()
+    if not title:
+        logger.debug("No title in server-rendered HTML: %s", url)
+        return None
+
+    article = build_article(
+        url,
+        title,
+        extract_published_datetime_text_html(doc),
+        extract_category_html(doc),
+        extract_body_html(doc, logger),
+    )
+
+    logger.info("Scraped article: %s (category=%s)", title, article["Category"] or "N/A")
+    return article
+
+
 # ---------- NOTIFICATIONS PAGINATION & MAIN LOOP ----------
 
 def scrape_notifications_page(
@@ -384,12 +676,12 @@ def scrape_notifications_page(
     - Load notifications page
     - Repeatedly:
         - Collect notification items (new ones since last iteration)
-        - For each, open article in new tab and scrape
+        - Fetch their articles concurrently over HTTP (or in the article tab) and scrape
         - Stop when article's PublishedAt < until_dt
         - Otherwise click "المزيد" to load older notifs
     """
-    # Load existing CSV and dedupe set
-    all_rows, existing_urls = load_existing_articles(csv_path, logger)
+    # Load dedupe set from existing CSV
+    existing_urls = load_existing_urls(csv_path, logger)
 
     logger.info("Opening notifications page: %s", base_url)
     driver.get(base_url)
@@ -398,148 +690,207 @@ def scrape_notifications_page(
     # FAST POPUP + OVERLAY CLEANUP (optimized)
     # --------------------------------------------------
 
-    # 1. Immediately remove potential blocking overlays (non-blocking)
+    # Overlays, push popup and cookie banner in one script (no WebDriverWaits);
+    # anything that isn't on the page is simply skipped.
     try:
-        driver.execute_script("""
-            var el1 = document.getElementById('dvPushSoftImpRequest');
-            if (el1) el1.remove();
-            var el2 = document.querySelector('.push-notication-parent');
-            if (el2) el2.remove();
-        """)
-        logger.info("Pre-cleaned notification overlays.")
-    except Exception:
-        logger.debug("Overlay pre-clean failed (ignored).")
+        cleanup = driver.execute_script("""
+            function removeOverlays() {
+                var el1 = document.getElementById('dvPushSoftImpRequest');
+                if (el1) el1.remove();
+                var el2 = document.querySelector('.push-notication-parent');
+                if (el2) el2.remove();
+            }
 
-    # 2. Try closing the push notification popup (the close icon)
-    try:
-        close_btn = driver.find_element(By.CSS_SELECTOR, ".push-notification-close-icon")
-        driver.execute_script("arguments[0].click();", close_btn)
-        logger.info("Closed push notification popup.")
-    except Exception:
-        logger.info("No push notification popup detected (or already closed).")
+            removeOverlays();
 
-    # 3. For safety, remove overlays again
-    try:
-        driver.execute_script("""
-            var el1 = document.getElementById('dvPushSoftImpRequest');
-            if (el1) el1.remove();
-            var el2 = document.querySelector('.push-notication-parent');
-            if (el2) el2.remove();
-        """)
-        logger.info("Post-popup overlay cleanup done.")
-    except Exception:
-        logger.debug("Post-popup overlay cleanup skipped.")
+            var closedPush = false;
+            var closeBtn = document.querySelector('.push-notification-close-icon');
+            if (closeBtn) {
+                closeBtn.click();
+                closedPush = true;
+            }
 
-    # 4. Cookie banner — fast, non-blocking (1 second max)
-    try:
-        cookie_btn = WebDriverWait(driver, 1).until(
-            EC.presence_of_element_located(
-                (By.XPATH, "//button[contains(text(),'أوافق') or contains(text(),'موافق') or contains(text(),'Accept')]")
-            )
-        )
-        driver.execute_script("arguments[0].click();", cookie_btn)
-        logger.info("Accepted cookie banner.")
+            // For safety, remove overlays again
+            removeOverlays();
+
+            var acceptedCookies = false;
+            for (const b of document.querySelectorAll('button')) {
+                if (/أوافق|موافق|Accept/.test(b.textContent || '')) {
+                    b.click();
+                    acceptedCookies = true;
+                    break;
+                }
+            }
+
+            return {closedPush: closedPush, acceptedCookies: acceptedCookies};
+        """)
+        logger.info("Cleaned notification overlays.")
+        if cleanup["closedPush"]:
+            logger.info("Closed push notification popup.")
+        else:
+            logger.info("No push notification popup detected (or already closed).")
+        if cleanup["acceptedCookies"]:
+            logger.info("Accepted cookie banner.")
+        else:
+            logger.info("No cookie banner found. Continuing...")
     except Exception:
-        logger.info("No cookie banner found (or failed to click). Continuing...")
+        logger.debug("Popup/overlay cleanup failed (ignored).", exc_info=True)
 
     # Wait for notifications to show up
     WebDriverWait(driver, 10).until(
         EC.presence_of_element_located((By.CSS_SELECTOR, NOTIF_ITEM_SELECTOR))
     )
 
+    # Articles are fetched over plain HTTP; Selenium is only needed for paging
+    session = create_http_session(driver)
+
+    # Single tab reused for any article that has to go through Selenium
+    article_tab = open_article_tab(driver)
+
     processed_notif_count = 0
     stop = False
 
-    while not stop:
-        logger.info("Collecting notification items...")
+    # Append new rows as they come; the newest-first reorder happens once at the end
+    csvfile, writer = open_csv_for_append(csv_path)
+    added = 0
+    try:
+        while not stop:
+            logger.info("Collecting notification items...")
+
+            # Time/URL/title of only the items added since last round, in one call
+            notifs = driver.execute_script(
+                """
+                const items = document.querySelectorAll(arguments[0]);
+                const fresh = Array.from(items).slice(arguments[1]).map(el => {
+                    const t = el.querySelector(arguments[2]);
+                    const a = el.querySelector(arguments[3]);
+                    return {
+                        time: t ? t.textContent.trim() : '',
+                        url: a ? (a.href || '') : null,
+                        title: a ? a.textContent.trim() : '',
+                    };
+                });
+                return {total: items.length, items: fresh};
+                """,
+                NOTIF_ITEM_SELECTOR,
+                processed_notif_count,
+                NOTIF_TIME_SELECTOR,
+                NOTIF_LINK_SELECTOR,
+            )
+            total_notifs = notifs["total"]
+            logger.info("Currently visible notifications: %d", total_notifs)
 
-        notif_items = driver.find_elements(By.CSS_SELECTOR, NOTIF_ITEM_SELECTOR)
-        logger.info("Currently visible notifications: %d", len(notif_items))
+            batch = []
+            batch_urls: Set[str] = set()
 
-        # Process only new items (since last round)
-        for idx in range(processed_notif_count, len(notif_items)):
-            notif = notif_items[idx]
+            # Collect only new items (since last round)
+            for idx, notif in enumerate(notifs["items"], start=processed_notif_count):
+                notif_time_text = notif["time"]
+                url = notif["url"]
+                title_preview = notif["title"]
 
-            # Extract time & URL
-            try:
-                time_el = notif.find_element(By.CSS_SELECTOR, NOTIF_TIME_SELECTOR)
-                notif_time_text = time_el.text.strip()
-            except NoSuchElementException:
-                notif_time_text = ""
+                if url is None:
+                    logger.warning("Notification item without link, skipping.")
+                    continue
 
-            try:
-                link_el = notif.find_element(By.CSS_SELECTOR, NOTIF_LINK_SELECTOR)
-                url = link_el.get_attribute("href")
-                title_preview = link_el.text.strip()
-            except NoSuchElementException:
-                logger.warning("Notification item without link, skipping.")
-                continue
-
-            if not url:
-                logger.warning("Notification link missing URL, skipping.")
-                continue
-
-            logger.info(
-                "[%d/%d] Time=%s | Title='%s'",
-                idx + 1,
-                len(notif_items),
-                notif_time_text,
-                title_preview[:80],
-            )
+                if not url:
+                    logger.warning("Notification link missing URL, skipping.")
+                    continue
 
-            # Already scraped?
-            if url in existing_urls:
-                logger.debug("URL already scraped, skipping: %s", url)
-                continue
-
-            # Scrape full article in new tab
-            article = scrape_article_in_new_tab(driver, url, logger)
-            if not article:
-                logger.warning("Failed to scrape article, moving on: %s", url)
-                continue
-
-            # Determine if we should stop based on published datetime
-            published_at_str = article.get("PublishedAt")
-            published_dt = None
-            if published_at_str:
-                try:
-                    published_dt = datetime.fromisoformat(published_at_str)
-                except Exception:
-                    logger.debug("Failed to parse PublishedAt isoformat: %s", published_at_str)
-
-            if published_dt and published_dt < until_dt:
                 logger.info(
-                    "Article %s is older than 'until' (%s < %s). Stopping.",
-                    article["Title"],
-                    published_dt,
-                    until_dt,
+                    "[%d/%d] Time=%s | Title='%s'",
+                    idx + 1,
+                    total_notifs,
+                    notif_time_text,
+                    title_preview[:80],
                 )
-                stop = True
-                break
 
-            # Write article to CSV (prepend at top)
-            prepend_article_to_csv_top(csv_path, all_rows, existing_urls, article, logger)
+                # Already scraped?
+                if url in existing_urls or url in batch_urls:
+                    logger.debug("URL already scraped, skipping: %s", url)
+                    continue
+
+                batch_urls.add(url)
+                batch.append((idx, url))
+
+            # Scrape the whole batch concurrently over HTTP
+            articles: Dict[int, Dict[str, str]] = {}
+            stop_idx = None
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+                futures = {
+                    ex.submit(scrape_article_http, session, url, logger): (idx, url)
+                    for idx, url in batch
+                }
+                for future in as_completed(futures):
+                    idx, url = futures[future]
+                    # Older than an article already past 'until'; result not needed
+                    if stop_idx is not None and idx > stop_idx:
+                        continue
 
-        processed_notif_count = len(notif_items)
+                    try:
+                        article = future.result()
+                    except Exception as e:
+                        logger.error("HTTP scrape failed for %s: %s", url, e)
+                        logger.debug("Full traceback:", exc_info=True)
+                        article = None
+                    if not article:
+                        # Selenium is not thread-safe: fall back on this thread only
+                        logger.debug("Falling back to Selenium for article: %s", url)
+                        article = scrape_article_in_tab(driver, article_tab, url, logger)
+                    if not article:
+                        logger.warning("Failed to scrape article, moving on: %s", url)
+                        continue
+
+                    # Determine if we should stop based on published datetime
+                    published_dt = get_published_dt(article, logger)
+                    if published_dt and published_dt < until_dt:
+                        logger.info(
+                            "Article %s is older than 'until' (%s < %s). Stopping.",
+                            article["Title"],
+                            published_dt,
+                            until_dt,
+                        )
+                        if stop_idx is None or idx < stop_idx:
+                            stop_idx = idx
+                            for f, (other_idx, _other_url) in futures.items():
+                                if other_idx > stop_idx:
+                                    f.cancel()
+                        continue
+
+                    articles[idx] = article
+
+            stop = stop_idx is not None
+
+            # Write articles to CSV in notification order
+            for idx in sorted(articles):
+                if stop and idx > stop_idx:
+                    continue
+                if append_article_to_csv(csvfile, writer, existing_urls, articles[idx], logger):
+                    added += 1
+
+            processed_notif_count = total_notifs
+
+            if stop:
+                break
 
-        if stop:
-            break
+            # Try to click "more" / "المزيد" to load older notifications
+            try:
+                logger.info("Trying to click 'more' (المزيد) to load older notifications...")
+                more_btn = WebDriverWait(driver, 10).until(
+                    EC.element_to_be_clickable((By.XPATH, LOAD_MORE_XPATH))
+                )
+                driver.execute_script("arguments[0].scrollIntoView(true);", more_btn)
+                time.sleep(0.2)
+                driver.execute_script("arguments[0].click();", more_btn)
+                time.sleep(1.5)  # wait for new items to load
+            except TimeoutException:
+                logger.info("No more 'المزيد' button found; reached end of notifications.")
+                break
+    finally:
+        csvfile.close()
+        move_new_rows_to_top(csv_path, added, logger)
 
-        # Try to click "more" / "المزيد" to load older notifications
-        try:
-            logger.info("Trying to click 'more' (المزيد) to load older notifications...")
-            more_btn = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, LOAD_MORE_XPATH))
-            )
-            driver.execute_script("arguments[0].scrollIntoView(true);", more_btn)
-            time.sleep(0.2)
-            driver.execute_script("arguments[0].click();", more_btn)
-            time.sleep(1.5)  # wait for new items to load
-        except TimeoutException:
-            logger.info("No more 'المزيد' button found; reached end of notifications.")
-            break
-
-    logger.info("Done. Total rows in CSV now: %d", len(all_rows))
+    logger.info("Done. Added %d new rows to CSV.", added)
 
 
 # ---------- MAIN ENTRYPOINT ----------